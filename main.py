@@ -1,11 +1,12 @@
 """CLI entry point for running the FastMCP hackathon server."""
 
-from server import app
+from server import create_app, preload
 
 
 def main() -> None:
-    """Run the FastMCP server using the shared application instance."""
-    app.run()
+    """Build the FastMCP application and run it over stdio."""
+    preload()
+    create_app().run()
 
 
 if __name__ == "__main__":
@@ -1,28 +1,260 @@
 """FastMCP server providing hackathon resources."""
 
+import hashlib
+import mmap
+import os
+import re
+from functools import cache, lru_cache
 from pathlib import Path
-from fastmcp import FastMCP
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+    from mcp.types import PromptMessage
 
 APP_NAME = "denver-hackathon"
 APP_DESCRIPTION = "Provides the MCP Server Hackathon overview and information."
 
-app = FastMCP(name=APP_NAME, instructions=APP_DESCRIPTION)
-
 BASE_DIR = Path(__file__).parent
 HACKATHON_MARKDOWN_PATH = BASE_DIR / "resources" / "hackathon_overview.md"
+PROMPT_TEMPLATE_PATH = BASE_DIR / "resources" / "fastmcp_prompt_template.md"
+
+
+def _read_utf8(path: Path) -> str:
+    """Read a whole file with raw os calls, skipping TextIOWrapper overhead."""
+    fd = os.open(str(path), os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        return os.read(fd, size).decode("utf-8")
+    finally:
+        os.close(fd)
+
+
+@cache
+def _hackathon_mmap() -> mmap.mmap:
+    """Map the overview read-only so the kernel page cache backs its bytes.
+
+    The mapping stays alive for the process via the cache, giving hashing
+    and decoding a zero-copy view of the file instead of a heap copy.
+    """
+    fd = os.open(str(HACKATHON_MARKDOWN_PATH), os.O_RDONLY)
+    try:
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+
+@cache
+def _hackathon_markdown() -> str:
+    """Decode the mapped overview on first use; cached for the process."""
+    return _hackathon_mmap()[:].decode("utf-8")
+
+
+@cache
+def _prompt_template() -> str:
+    """Read the FastMCP prompt template on first use; cached for the process."""
+    return _read_utf8(PROMPT_TEMPLATE_PATH)
+
+
+@cache
+def _sections() -> dict[str, str]:
+    """Index the overview by its ``##`` headings, built once on first use.
 
-HACKATHON_MARKDOWN = HACKATHON_MARKDOWN_PATH.read_text(encoding="utf-8")
+    Keys are lowercased heading text; values are the full section including
+    its heading line, so targeted queries ship one section instead of the
+    whole document.
+    """
+    sections: dict[str, str] = {}
+    for chunk in ("\n" + _hackathon_markdown()).split("\n## ")[1:]:
+        head, _, _body = chunk.partition("\n")
+        sections[head.strip().lower()] = "## " + chunk
+    return sections
+
+
+@cache
+def _lines() -> tuple[str, ...]:
+    """The overview split into lines once, reused by every snippet search."""
+    return tuple(_hackathon_markdown().splitlines())
+
+
+@lru_cache(maxsize=64)
+def _query_pattern(query: str) -> re.Pattern[str]:
+    """Case-insensitive pattern for a query, compiled once per distinct query."""
+    return re.compile(re.escape(query), re.IGNORECASE)
+
+
+@cache
+def _prompt_messages() -> tuple["PromptMessage", ...]:
+    """Build the static prompt messages once; renders reuse the same objects."""
+    from fastmcp.prompts import Message
 
-@app.tool()
-def get_hackathon_info() -> str:
-    """Get the complete hackathon overview with all information about the MCP Server Hackathon.
-    
-    Returns:
-        The full hackathon overview document including format, getting started guide, 
-        project ideas, resources, and quick reference.
+    return (
+        Message(
+            role="assistant",
+            content=(
+                "You are an expert FastMCP engineer helping a developer build a "
+                "Python MCP server that integrates cleanly with Cursor."
+            ),
+        ),
+        Message(role="user", content=_prompt_template()),
+    )
+
+
+@cache
+def _hackathon_etag() -> str:
+    """Stable ETag for the overview so caches can validate repeat fetches."""
+    return hashlib.blake2b(_hackathon_mmap(), digest_size=16).hexdigest()
+
+
+def preload() -> None:
+    """Warm the resource caches and derived structures before serving.
+
+    Hints the kernel to read both files ahead of time, triggers the two
+    cached first reads on a small thread pool so their I/O overlaps instead
+    of running back to back, then builds the structures derived from them.
+    Importing the module never runs any of this; the entry points call it
+    right before ``app.run()`` so the first request hits warm caches.
     """
-    return HACKATHON_MARKDOWN
+    from concurrent.futures import ThreadPoolExecutor
+
+    if hasattr(os, "posix_fadvise"):
+        for path in (HACKATHON_MARKDOWN_PATH, PROMPT_TEMPLATE_PATH):
+            fd = os.open(str(path), os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        executor.submit(_hackathon_markdown)
+        executor.submit(_prompt_template)
+
+    _sections()
+    _lines()
+    _hackathon_etag()
+    _prompt_messages()
+
+
+def create_app(mode: Literal["resource", "tool", "both"] = "both") -> "FastMCP":
+    """Build a FastMCP application, registering handlers for the given mode.
+
+    The fastmcp import happens here rather than at module scope because it
+    pulls in a large transitive dependency tree; importing ``server`` for its
+    constants stays cheap and the cost is only paid when the app is needed.
+
+    Args:
+        mode: Which handlers to register. ``"resource"`` serves the overview
+            only as a resource, ``"tool"`` only as a tool, and ``"both"``
+            (the default) registers everything. The prompt is registered in
+            every mode.
+    """
+    if mode not in ("resource", "tool", "both"):
+        raise ValueError(f"unknown mode: {mode!r}")
+    # Resolve the default before the cached call so create_app() and
+    # create_app(mode="both") share one cache entry and one app instance.
+    return _build_app(mode)
+
+
+@cache
+def _build_app(mode: str) -> "FastMCP":
+    """Construct and cache the app for a mode; one mode, one instance."""
+
+    from fastmcp import FastMCP
+    from mcp.types import PromptMessage
+
+    app = FastMCP(name=APP_NAME, instructions=APP_DESCRIPTION)
+    registered = {}
+
+    if mode in ("resource", "both"):
+
+        @app.resource(
+            "resource://hackathon-overview",
+            name="Hackathon Overview",
+            mime_type="text/markdown",
+        )
+        def hackathon_overview() -> str:
+            """Serve the full hackathon overview document as markdown."""
+            return _hackathon_markdown()
+
+        registered["hackathon_overview"] = hackathon_overview
+
+        @app.resource(
+            "resource://hackathon-overview/etag",
+            name="Hackathon Overview ETag",
+            mime_type="text/plain",
+        )
+        def hackathon_overview_etag() -> str:
+            """Serve the overview's ETag; clients can skip re-fetching the
+            full document when the hash they hold still matches."""
+            return _hackathon_etag()
+
+        registered["hackathon_overview_etag"] = hackathon_overview_etag
+
+    if mode in ("tool", "both"):
+
+        @app.tool()
+        def get_hackathon_info(query: str = "") -> str:
+            """Get information about the MCP Server Hackathon.
+
+            Args:
+                query: Optional section name (for example "Getting Started" or
+                    "Project Ideas") or free-text search term. Section matches
+                    return the whole section; other terms return the matching
+                    lines. Without a query the full overview document is returned.
+
+            Returns:
+                The matching section or lines of the hackathon overview, or the
+                full document including format, getting started guide, project
+                ideas, resources, and quick reference.
+            """
+            q = query.strip().lower()
+            if not q:
+                return _hackathon_markdown()
+            sections = _sections()
+            hit = sections.get(q) or next(
+                (body for name, body in sections.items() if q in name), None
+            )
+            if hit:
+                return hit
+            pattern = _query_pattern(q)
+            snippets = [line for line in _lines() if pattern.search(line)]
+            if snippets:
+                return "\n".join(snippets)
+            return _hackathon_markdown()
+
+        registered["get_hackathon_info"] = get_hackathon_info
+
+    @app.prompt
+    def fastmcp_python_prompt() -> tuple[PromptMessage, ...]:
+        """Guide the model through building a Python FastMCP server for Cursor."""
+        return _prompt_messages()
+
+    registered["fastmcp_python_prompt"] = fastmcp_python_prompt
+
+    if mode == "both":
+        globals().update(app=app, **registered)
+    return app
+
+
+_LAZY_ATTRS = frozenset(
+    {
+        "app",
+        "hackathon_overview",
+        "hackathon_overview_etag",
+        "get_hackathon_info",
+        "fastmcp_python_prompt",
+    }
+)
+
+
+def __getattr__(name: str):
+    """Expose the app and its handlers lazily, building them on first access."""
+    if name in _LAZY_ATTRS:
+        create_app()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
-    app.run()
+    preload()
+    create_app().run()
@@ -8,3 +8,13 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+import pytest
+
+import server
+
+
+@pytest.fixture(scope="session")
+def hackathon_md() -> str:
+    """The hackathon overview, lazily loaded exactly once for the suite."""
+    return server._hackathon_markdown()
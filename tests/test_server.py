@@ -1,39 +1,75 @@
-import asyncio
-
-import pytest
-
 import server
 
 
 def test_app_metadata_matches_constants():
-    assert getattr(server.app, "name", None) == server.APP_NAME
-    assert getattr(server.app, "instructions", None) == server.APP_DESCRIPTION
+    assert server.app.name == server.APP_NAME
+    assert server.app.instructions == server.APP_DESCRIPTION
 
 
-def test_hackathon_overview_returns_expected_resource():
+async def test_hackathon_overview_returns_expected_resource(hackathon_md):
     resource = server.hackathon_overview
     assert resource.name == "Hackathon Overview"
     assert resource.mime_type == "text/markdown"
-    assert asyncio.run(resource.read()) == server.HACKATHON_MARKDOWN
+    assert await resource.read() == hackathon_md
 
 
-@pytest.mark.parametrize("expected_segment", [
+_EXPECTED_SECTIONS = {
     "## Overview",
-    "## Goals",
-    "## Architecture at a Glance",
+    "## Hackathon Format",
     "## Getting Started",
-    "## Unique Project Ideas",
-    "## Rules and Format",
+    "## Implementation Essentials",
+    "## Tool Design Best Practices",
+    "## Project Ideas",
+    "## Demo Preparation",
     "## Resources",
-    "## Let’s Build",
-])
-def test_hackathon_markdown_contains_key_sections(expected_segment):
-    assert expected_segment in server.HACKATHON_MARKDOWN
+    "## Quick Reference",
+    "## Let's Build!",
+}
+
+
+def test_hackathon_markdown_contains_key_sections(hackathon_md):
+    lines = hackathon_md.splitlines()
+    found = {line for line in lines if line in _EXPECTED_SECTIONS}
+    assert found == _EXPECTED_SECTIONS
+
+
+async def test_hackathon_overview_etag_matches_document():
+    etag = server.hackathon_overview_etag
+    assert etag.mime_type == "text/plain"
+    assert await etag.read() == server._hackathon_etag()
+
+
+async def test_create_app_modes_register_expected_handlers():
+    resource_app = server.create_app(mode="resource")
+    assert not await resource_app.get_tools()
+    assert "resource://hackathon-overview" in await resource_app.get_resources()
+
+    tool_app = server.create_app(mode="tool")
+    assert not await tool_app.get_resources()
+    assert "get_hackathon_info" in await tool_app.get_tools()
+
+    both_app = server.create_app(mode="both")
+    assert "get_hackathon_info" in await both_app.get_tools()
+    assert "resource://hackathon-overview" in await both_app.get_resources()
+
+
+def test_get_hackathon_info_filters_by_section(hackathon_md):
+    tool = server.get_hackathon_info
+    assert tool.fn() == hackathon_md
+    assert tool.fn(query="Getting Started").startswith("## Getting Started")
+    assert tool.fn(query="zzz no such text") == hackathon_md
+
+
+def test_get_hackathon_info_returns_matching_lines():
+    snippets = server.get_hackathon_info.fn(query="JSON-RPC")
+    assert snippets
+    for line in snippets.splitlines():
+        assert "json-rpc" in line.lower()
 
 
-def test_fastmcp_python_prompt_has_two_messages():
+async def test_fastmcp_python_prompt_has_two_messages():
     prompt = server.fastmcp_python_prompt
-    messages = asyncio.run(prompt.render())
+    messages = await prompt.render()
     assert len(messages) == 2
 
     system_message, user_message = messages
@@ -41,10 +77,10 @@ def test_fastmcp_python_prompt_has_two_messages():
     assert "FastMCP engineer" in system_message.content.text
 
     assert user_message.role == "user"
-    assert user_message.content.text == server.PROMPT_TEMPLATE
+    assert user_message.content.text == server._prompt_template()
 
 
 def test_prompt_template_guidance():
-    template = server.PROMPT_TEMPLATE
+    template = server._prompt_template()
     for keyword in ("fastmcp", "@app.resource", "structured results"):
         assert keyword in template